@@ -457,13 +457,11 @@ class Agent:
         )
 
         def run() -> None:
-            # Ensure there's an active event loop in this thread
+            # This is a fresh thread, so it never has an event loop of its own; create
+            # one directly rather than probing with the deprecated `get_event_loop`
             import asyncio
 
-            try:
-                asyncio.get_event_loop()
-            except RuntimeError:
-                asyncio.set_event_loop(asyncio.new_event_loop())
+            asyncio.set_event_loop(asyncio.new_event_loop())
 
             self.logger.debug(
                 f"Agent API server listening on port {self.agent_address}"
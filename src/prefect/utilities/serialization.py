@@ -2,6 +2,7 @@ import base64
 import datetime
 import inspect
 import json
+import re
 import sys
 import types
 from typing import Any, Callable, List
@@ -22,6 +23,11 @@ from marshmallow import (
 
 import prefect
 
+# matches the canonical (lowercase, hyphenated) form produced by `str(uuid.UUID(...))`
+_CANONICAL_UUID = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+)
+
 
 def to_qualified_name(obj: Any) -> str:
     """
@@ -293,6 +299,9 @@ class UUID(fields.UUID):
         return super()._serialize(value, attr, obj, **kwargs)
 
     def _deserialize(self, value, attr, data, **kwargs):  # type: ignore
+        # canonical strings would round-trip unchanged, so skip building a UUID
+        if isinstance(value, str) and _CANONICAL_UUID.fullmatch(value):
+            return value
         return str(super()._deserialize(value, attr, data, **kwargs))
 
 
@@ -312,11 +321,22 @@ class DateTimeTZ(fields.DateTime):
     def _serialize(self, value, attr, obj, **kwargs):  # type: ignore
         if value is not None:
             dt = pendulum.instance(value)
-            return dict(dt=dt.naive().to_iso8601_string(), tz=dt.tzinfo.name)
+            # `to_iso8601_string` on a naive datetime is just `isoformat`, minus the
+            # extra dispatch through pendulum's string formatters
+            return dict(dt=dt.naive().isoformat(), tz=dt.tzinfo.name)
 
     def _deserialize(self, value, attr, data, **kwargs):  # type: ignore
         if value is not None:
-            return pendulum.parse(value["dt"], tz=value["tz"])
+            # `_serialize` writes naive `isoformat` strings, which the stdlib parses
+            # much faster than `pendulum.parse`; fall back for any other format, and
+            # for offset-aware strings so the zone matches what `pendulum.parse` gives
+            try:
+                dt = datetime.datetime.fromisoformat(value["dt"])
+            except ValueError:
+                return pendulum.parse(value["dt"], tz=value["tz"])
+            if dt.tzinfo is not None:
+                return pendulum.parse(value["dt"], tz=value["tz"])
+            return pendulum.instance(dt, tz=value["tz"])
 
 
 class FunctionReference(fields.Field):
@@ -138,6 +138,25 @@ class TestUUIDField:
         deserialized = self.Schema().load(dict(u=u))
         assert deserialized["u"] == u
 
+    @pytest.mark.parametrize(
+        "u",
+        [
+            "{12345678-1234-5678-1234-567812345678}",
+            "12345678123456781234567812345678",
+            "12345678-1234-5678-1234-56781234567A",
+        ],
+    )
+    def test_deserialize_non_canonical_str(self, u):
+        deserialized = self.Schema().load(dict(u=u))
+        assert deserialized["u"] == str(uuid.UUID(u))
+
+    @pytest.mark.parametrize(
+        "u", ["not-a-uuid", "12345678-1234-5678-1234-56781234567g"]
+    )
+    def test_deserialize_invalid_str(self, u):
+        with pytest.raises(marshmallow.ValidationError):
+            self.Schema().load(dict(u=u))
+
 
 class TestDateTimeTZField:
 
@@ -167,6 +186,17 @@ class TestDateTimeTZField:
         deserialized = schema.load(schema.dump(dict(dt=dt)))
         assert deserialized["dt"] == pendulum.instance(dt)
 
+    @pytest.mark.parametrize(
+        "dt_str", ["2018-03-11 09:00", "20180311T090000", "2018-03-11T09:00:00Z"]
+    )
+    def test_deserialize_non_isoformat_strings(self, dt_str):
+        value = dict(dt=dt_str, tz="America/New_York")
+        deserialized = self.Schema().load(dict(dt=value))
+        expected = pendulum.parse(dt_str, tz="America/New_York")
+        assert deserialized["dt"] == expected
+        assert deserialized["dt"].tzinfo.name == expected.tzinfo.name
+        assert deserialized["dt"].utcoffset() == expected.utcoffset()
+
     def test_deserialize_respects_dst(self):
         dt = pendulum.datetime(2018, 3, 11, tz="America/New_York")
         schema = self.Schema()